@@ -1,10 +1,67 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import asyncio
 import time
 import io
-from email_verifier import EmailVerifier
+from email_verifier import EmailVerifier, CONNECTION_FAILURES, GREYLISTED
 from excel_processor import ExcelProcessor
 
+# Refresh progress widgets once per this many verified emails
+UPDATE_EVERY = 10
+
+# Minimum number of verified emails before the failure-rate guard can abort
+ABORT_MIN_CHECKED = 30
+
+# Excel uploads above this size trigger a hint to convert them to CSV
+LARGE_EXCEL_BYTES = 20 * 1024 * 1024
+
+
+@st.cache_data
+def _read_upload_cached(file_bytes: bytes, is_csv: bool) -> pd.DataFrame:
+    """Parse an uploaded file once per distinct file content"""
+    processor = ExcelProcessor()
+    if is_csv:
+        return processor.read_csv(file_bytes)
+    return processor.read_excel(file_bytes)
+
+
+@st.cache_data
+def _detect_email_columns(file_bytes: bytes, is_csv: bool) -> list:
+    """Detect email columns once per distinct file content"""
+    return ExcelProcessor().detect_email_columns(_read_upload_cached(file_bytes, is_csv))
+
+
+@st.cache_data
+def _extract_valid_emails(file_bytes: bytes, is_csv: bool, email_column: str) -> list:
+    """Extract valid emails once per distinct file content and column"""
+    processor = ExcelProcessor()
+    
+    if is_csv:
+        return processor.extract_valid_emails_csv(file_bytes, email_column)
+    
+    # Stream only the email column from .xlsx files; fall back to the full read for .xls
+    try:
+        valid_emails = []
+        for chunk in processor.read_excel_streaming(file_bytes, target_columns=[email_column]):
+            valid_emails.extend(processor.extract_valid_emails(chunk, email_column))
+        return list(dict.fromkeys(valid_emails))
+    except Exception:
+        return processor.extract_valid_emails(_read_upload_cached(file_bytes, is_csv), email_column)
+
+
+def classify_result(is_valid, details):
+    """Map a verifier result to the status shown in the results"""
+    if is_valid:
+        return 'Valid'
+    elif details == 'error' or details in CONNECTION_FAILURES:
+        return 'Error'
+    elif details.startswith(GREYLISTED):
+        return 'Greylisted'
+    else:
+        return 'Invalid'
+
+
 def main():
     st.set_page_config(
         page_title="Bulk Email Verification Tool",
@@ -13,7 +70,7 @@ def main():
     )
     
     st.title("📧 Bulk Email Verification Tool")
-    st.markdown("Upload an Excel file to verify email addresses using SMTP validation")
+    st.markdown("Upload an Excel or CSV file to verify email addresses using SMTP validation")
     
     # Initialize session state
     if 'verification_results' not in st.session_state:
@@ -24,18 +81,23 @@ def main():
         st.session_state.email_column = None
     
     # File upload section
-    st.header("1. Upload Excel File")
+    st.header("1. Upload Excel or CSV File")
     uploaded_file = st.file_uploader(
-        "Choose an Excel file (.xlsx, .xls)",
-        type=['xlsx', 'xls'],
-        help="Upload an Excel file containing email addresses"
+        "Choose an Excel or CSV file (.xlsx, .xls, .csv)",
+        type=['xlsx', 'xls', 'csv'],
+        help="Upload an Excel or CSV file containing email addresses"
     )
     
     if uploaded_file is not None:
         try:
-            # Process the uploaded file
-            processor = ExcelProcessor()
-            df = processor.read_excel(uploaded_file)
+            # Process the uploaded file (cached on its contents across reruns)
+            file_bytes = uploaded_file.getvalue()
+            is_csv = uploaded_file.name.lower().endswith('.csv')
+            
+            if not is_csv and len(file_bytes) > LARGE_EXCEL_BYTES:
+                st.toast("💡 Large Excel file: exporting it to CSV first will load much faster")
+            
+            df = _read_upload_cached(file_bytes, is_csv)
             
             st.success(f"✅ File uploaded successfully! Found {len(df)} rows")
             
@@ -43,91 +105,110 @@ def main():
             st.subheader("File Preview")
             st.dataframe(df.head(10), use_container_width=True)
             
-            # Email column detection/selection
-            st.header("2. Select Email Column")
+            # Column selection, verification and results rerun independently
+            select_and_verify_emails(df, file_bytes, is_csv)
+        
+        except Exception as e:
+            st.error(f"❌ Error processing file: {str(e)}")
+
+
+@st.fragment
+def select_and_verify_emails(df, file_bytes, is_csv):
+    """Select the email column, run verification and show results"""
+    # Email column detection/selection
+    st.header("2. Select Email Column")
+    
+    # Auto-detect email columns
+    email_columns = _detect_email_columns(file_bytes, is_csv)
+    
+    if email_columns:
+        st.info(f"🔍 Auto-detected potential email columns: {', '.join(email_columns)}")
+        default_column = email_columns[0]
+    else:
+        st.warning("⚠️ No email columns auto-detected. Please select manually.")
+        default_column = df.columns[0] if len(df.columns) > 0 else None
+    
+    # Column selection
+    email_column = st.selectbox(
+        "Select the column containing email addresses:",
+        options=df.columns.tolist(),
+        index=df.columns.tolist().index(default_column) if default_column in df.columns else 0
+    )
+    
+    # Show sample emails from selected column
+    if email_column:
+        st.session_state.email_column = email_column
+        st.session_state.original_df = df
+        
+        sample_emails = df[email_column].dropna().head(5).tolist()
+        st.write("Sample emails from selected column:")
+        for email in sample_emails:
+            st.write(f"• {email}")
+        
+        # Email verification section
+        st.header("3. Email Verification")
+        
+        # Get valid emails for verification
+        valid_emails = _extract_valid_emails(file_bytes, is_csv, email_column)
+        total_emails = len(valid_emails)
+        
+        if total_emails > 0:
+            st.info(f"📊 Found {total_emails} valid email addresses to verify")
+            
+            # Verification settings
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                delay_between_checks = st.slider(
+                    "Delay between checks (seconds)",
+                    min_value=0.5,
+                    max_value=5.0,
+                    value=1.0,
+                    step=0.5,
+                    help="Delay between checks against the same domain to avoid overwhelming SMTP servers"
+                )
             
-            # Auto-detect email columns
-            email_columns = processor.detect_email_columns(df)
+            with col2:
+                timeout_seconds = st.slider(
+                    "SMTP timeout (seconds)",
+                    min_value=5,
+                    max_value=30,
+                    value=10,
+                    help="Timeout for SMTP connections"
+                )
             
-            if email_columns:
-                st.info(f"🔍 Auto-detected potential email columns: {', '.join(email_columns)}")
-                default_column = email_columns[0]
-            else:
-                st.warning("⚠️ No email columns auto-detected. Please select manually.")
-                default_column = df.columns[0] if len(df.columns) > 0 else None
+            with col3:
+                abort_threshold = st.slider(
+                    "Abort on failure rate (%)",
+                    min_value=10,
+                    max_value=100,
+                    value=33,
+                    step=1,
+                    help=f"Stop early when this share of checks end in errors (after {ABORT_MIN_CHECKED} checks)"
+                )
             
-            # Column selection
-            email_column = st.selectbox(
-                "Select the column containing email addresses:",
-                options=df.columns.tolist(),
-                index=df.columns.tolist().index(default_column) if default_column in df.columns else 0
-            )
+            # Start verification button
+            if st.button("🚀 Start Email Verification", type="primary"):
+                verify_emails(df, email_column, valid_emails, delay_between_checks, timeout_seconds, abort_threshold / 100)
             
-            # Show sample emails from selected column
-            if email_column:
-                st.session_state.email_column = email_column
-                st.session_state.original_df = df
-                
-                sample_emails = df[email_column].dropna().head(5).tolist()
-                st.write("Sample emails from selected column:")
-                for email in sample_emails:
-                    st.write(f"• {email}")
-                
-                # Email verification section
-                st.header("3. Email Verification")
-                
-                # Get valid emails for verification
-                valid_emails = processor.extract_valid_emails(df, email_column)
-                total_emails = len(valid_emails)
-                
-                if total_emails > 0:
-                    st.info(f"📊 Found {total_emails} valid email addresses to verify")
-                    
-                    # Verification settings
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        delay_between_checks = st.slider(
-                            "Delay between checks (seconds)",
-                            min_value=0.5,
-                            max_value=5.0,
-                            value=1.0,
-                            step=0.5,
-                            help="Delay to avoid overwhelming SMTP servers"
-                        )
-                    
-                    with col2:
-                        timeout_seconds = st.slider(
-                            "SMTP timeout (seconds)",
-                            min_value=5,
-                            max_value=30,
-                            value=10,
-                            help="Timeout for SMTP connections"
-                        )
-                    
-                    # Start verification button
-                    if st.button("🚀 Start Email Verification", type="primary"):
-                        verify_emails(df, email_column, delay_between_checks, timeout_seconds)
-                    
-                    # Show results if available
-                    if st.session_state.verification_results is not None:
-                        show_verification_results()
-                
-                else:
-                    st.error("❌ No valid email addresses found in the selected column")
+            # Show results if available
+            if st.session_state.verification_results is not None:
+                show_verification_results()
         
-        except Exception as e:
-            st.error(f"❌ Error processing file: {str(e)}")
+        else:
+            st.error("❌ No valid email addresses found in the selected column")
 
 
-def verify_emails(df, email_column, delay, timeout):
+def verify_emails(df, email_column, valid_emails, delay, timeout, abort_threshold=0.33):
     """Perform email verification with progress tracking"""
     processor = ExcelProcessor()
     verifier = EmailVerifier(timeout=timeout)
     
     # Get emails to verify
-    valid_emails = processor.extract_valid_emails(df, email_column)
     total_emails = len(valid_emails)
     
+    # Group by domain so pooled SMTP connections are reused back to back
+    valid_emails = sorted(valid_emails, key=lambda email: email.split('@')[-1].lower())
+    
     if total_emails == 0:
         st.error("No valid emails to verify")
         return
@@ -142,69 +223,113 @@ def verify_emails(df, email_column, delay, timeout):
     valid_count = 0
     invalid_count = 0
     error_count = 0
+    greylisted_count = 0
+    aborted = False
     
-    # Create a copy of the dataframe for results
-    result_df = df.copy()
-    result_df['Email_Verification_Status'] = 'Not Checked'
-    result_df['Verification_Details'] = ''
+    def on_result(email, is_valid, details):
+        nonlocal verified_count, valid_count, invalid_count, error_count, greylisted_count, aborted
+        
+        verified_count += 1
+        status = classify_result(is_valid, details)
+        if status == 'Valid':
+            valid_count += 1
+        elif status == 'Error':
+            error_count += 1
+        elif status == 'Greylisted':
+            greylisted_count += 1
+        else:
+            invalid_count += 1
+        
+        # Stop early if failures dominate; the rest of the batch is unlikely to fare better
+        if verified_count >= ABORT_MIN_CHECKED and error_count / verified_count > abort_threshold:
+            aborted = True
+        
+        # Only refresh the UI every few results to limit re-render overhead
+        if verified_count % UPDATE_EVERY != 0 and verified_count != total_emails:
+            return
+        
+        # Update progress
+        status_text.text(f"Verified {verified_count}/{total_emails}: {email}")
+        progress_bar.progress(verified_count / total_emails)
+        
+        # Show intermediate results
+        with results_placeholder.container():
+            show_progress_metrics(valid_count, invalid_count, error_count, greylisted_count, verified_count, total_emails)
     
     try:
-        for index, row in df.iterrows():
-            email = row[email_column]
-            
-            if pd.isna(email) or not processor.is_valid_email_format(str(email)):
-                result_df.at[index, 'Email_Verification_Status'] = 'Invalid Format'
-                result_df.at[index, 'Verification_Details'] = 'Invalid email format'
+        # Resolve every domain's MX records up front so SMTP checks start immediately
+        domains = {email.split('@')[-1].lower() for email in valid_emails}
+        status_text.text(f"Resolving MX records for {len(domains)} domains...")
+        mx_hints = verifier.prefetch_mx(domains)
+        
+        # Verify emails concurrently across domains
+        results = asyncio.run(
+            verifier.verify_email_batch_async(
+                valid_emails,
+                delay=delay,
+                progress_callback=on_result,
+                should_stop=lambda: aborted,
+                mx_hints=mx_hints
+            )
+        )
+        
+        # Build the result columns as arrays, then assign them in one go
+        emails = df[email_column].to_numpy()
+        valid_mask = processor.valid_email_mask(df[email_column]).to_numpy()
+        statuses = np.full(len(df), 'Not Checked', dtype=object)
+        details = np.full(len(df), '', dtype=object)
+        
+        for i, email in enumerate(emails):
+            if not valid_mask[i]:
+                statuses[i] = 'Invalid Format'
+                details[i] = 'Invalid email format'
                 continue
             
-            # Update status
-            verified_count += 1
-            status_text.text(f"Verifying {verified_count}/{total_emails}: {email}")
-            
-            # Verify email
-            is_valid, details = verifier.verify_email(str(email))
-            
-            if is_valid:
-                result_df.at[index, 'Email_Verification_Status'] = 'Valid'
-                valid_count += 1
-            elif details == 'error':
-                result_df.at[index, 'Email_Verification_Status'] = 'Error'
-                error_count += 1
-            else:
-                result_df.at[index, 'Email_Verification_Status'] = 'Invalid'
-                invalid_count += 1
-            
-            result_df.at[index, 'Verification_Details'] = details
-            
-            # Update progress
-            progress = verified_count / total_emails
-            progress_bar.progress(progress)
-            
-            # Show intermediate results
-            with results_placeholder.container():
-                col1, col2, col3, col4 = st.columns(4)
-                col1.metric("✅ Valid", valid_count)
-                col2.metric("❌ Invalid", invalid_count)
-                col3.metric("⚠️ Errors", error_count)
-                col4.metric("📊 Progress", f"{verified_count}/{total_emails}")
+            result = results.get(str(email).strip())
+            if result is None:
+                continue
             
-            # Rate limiting
-            if verified_count < total_emails:
-                time.sleep(delay)
+            statuses[i] = classify_result(result['is_valid'], result['details'])
+            details[i] = result['details']
+        
+        # New frame sharing the original columns plus the two result columns
+        result_df = df.assign(Email_Verification_Status=statuses, Verification_Details=details)
         
         # Store results
         st.session_state.verification_results = result_df
         
+        if aborted:
+            status_text.text("⛔ Aborted — high failure rate")
+            st.error(
+                f"❌ Verification aborted after {verified_count} checks: {error_count} ended in errors. "
+                "Check that outbound port 25 is open and that the sender domain has a good reputation."
+            )
+            return
+        
         # Final status
         status_text.text("✅ Verification completed!")
         progress_bar.progress(1.0)
         
-        st.success(f"🎉 Email verification completed! Valid: {valid_count}, Invalid: {invalid_count}, Errors: {error_count}")
+        st.success(f"🎉 Email verification completed! Valid: {valid_count}, Invalid: {invalid_count}, Errors: {error_count}, Greylisted: {greylisted_count}")
         
     except Exception as e:
         st.error(f"❌ Error during verification: {str(e)}")
+    finally:
+        verifier.close_all()
+
+
+@st.fragment
+def show_progress_metrics(valid_count, invalid_count, error_count, greylisted_count, verified_count, total_emails):
+    """Render intermediate verification metrics without touching upstream widgets"""
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("✅ Valid", valid_count)
+    col2.metric("❌ Invalid", invalid_count)
+    col3.metric("⚠️ Errors", error_count)
+    col4.metric("⏳ Greylisted", greylisted_count)
+    col5.metric("📊 Progress", f"{verified_count}/{total_emails}")
 
 
+@st.fragment
 def show_verification_results():
     """Display verification results and download option"""
     st.header("4. Verification Results")
@@ -213,17 +338,19 @@ def show_verification_results():
         result_df = st.session_state.verification_results
         
         # Summary statistics
-        col1, col2, col3, col4 = st.columns(4)
+        col1, col2, col3, col4, col5 = st.columns(5)
         
         valid_count = len(result_df[result_df['Email_Verification_Status'] == 'Valid'])
         invalid_count = len(result_df[result_df['Email_Verification_Status'] == 'Invalid'])
         error_count = len(result_df[result_df['Email_Verification_Status'] == 'Error'])
+        greylisted_count = len(result_df[result_df['Email_Verification_Status'] == 'Greylisted'])
         total_count = len(result_df)
         
         col1.metric("Total Emails", total_count)
         col2.metric("✅ Valid", valid_count)
         col3.metric("❌ Invalid", invalid_count)
         col4.metric("⚠️ Errors", error_count)
+        col5.metric("⏳ Greylisted", greylisted_count)
         
         # Results table
         st.subheader("Detailed Results")
@@ -1,9 +1,72 @@
+import asyncio
 import smtplib
 import dns.resolver
+import dns.asyncresolver
+import aiosmtplib
+import pkgutil
+from concurrent.futures import ThreadPoolExecutor
 import socket
 import time
 import re
-from typing import Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Prefer RE2's linear-time matching when it is installed
+try:
+    import re2 as re_engine
+except ImportError:
+    re_engine = re
+
+
+# Cache lifetimes for MX lookups, in seconds
+MX_CACHE_TTL = 300
+NEGATIVE_MX_CACHE_TTL = 60
+
+# Providers that accept RCPT for any address or block verification probes,
+# so a resolving MX record is the strongest signal available
+_DOMAIN_POLICY = {
+    'gmail.com': 'mx_only',
+    'googlemail.com': 'mx_only',
+    'outlook.com': 'mx_only',
+    'hotmail.com': 'mx_only',
+    'live.com': 'mx_only',
+    'msn.com': 'mx_only',
+    'yahoo.com': 'mx_only',
+    'ymail.com': 'mx_only',
+    'aol.com': 'mx_only',
+    'icloud.com': 'mx_only',
+    'me.com': 'mx_only',
+    'mac.com': 'mx_only',
+}
+
+# Details prefix for temporary (4xx) RCPT failures such as greylisting
+GREYLISTED = "Greylisted"
+
+# Details returned when the MX host could not be reached at all
+CONNECTION_FAILURES = (
+    "Cannot connect to SMTP server",
+    "SMTP server disconnected",
+    "SMTP connection timeout",
+)
+
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+_EMAIL_RE = re_engine.compile(EMAIL_PATTERN)
+
+
+def _load_disposable_domains() -> frozenset:
+    """Load the bundled list of disposable email domains"""
+    try:
+        data = pkgutil.get_data(__name__, 'disposable_domains.txt')
+    except OSError:
+        return frozenset()
+    
+    lines = data.decode('utf-8').splitlines()
+    return frozenset(
+        line.strip().lower() for line in lines
+        if line.strip() and not line.startswith('#')
+    )
+
+
+DISPOSABLE_DOMAINS = _load_disposable_domains()
 
 
 class EmailVerifier:
@@ -22,16 +85,36 @@ class EmailVerifier:
         self.timeout = timeout
         self.sender_email = sender_email
         
-    def verify_email(self, email: str) -> Tuple[bool, str]:
+        # Open SMTP connections keyed by MX host, reused across recipients
+        self._smtp_pool: Dict[str, smtplib.SMTP] = {}
+        self._async_smtp_pool: Dict[str, aiosmtplib.SMTP] = {}
+        self._async_smtp_locks: Dict[str, asyncio.Lock] = {}
+        
+        # MX hosts keyed by domain, as (hosts, expires_at)
+        self._mx_cache: Dict[str, Tuple[List[str], float]] = {}
+        
+        # Results keyed by normalized email, so duplicates skip the network
+        self._email_cache: Dict[str, Tuple[bool, str]] = {}
+        self.disposable_domains = DISPOSABLE_DOMAINS
+        
+    def verify_email(self, email: str, mx_hint: Optional[List[str]] = None) -> Tuple[bool, str]:
         """
         Verify if an email address exists using SMTP validation
         
         Args:
             email: Email address to verify
+            mx_hint: Already-resolved MX hosts for the email's domain, skips the DNS lookup
             
         Returns:
             Tuple of (is_valid: bool, details: str)
         """
+        key = email.strip().lower()
+        if key not in self._email_cache:
+            self._email_cache[key] = self._verify_email_uncached(email, mx_hint)
+        return self._email_cache[key]
+    
+    def _verify_email_uncached(self, email: str, mx_hint: Optional[List[str]] = None) -> Tuple[bool, str]:
+        """Run the DNS and SMTP checks for a single email"""
         try:
             # Basic format validation
             if not self._is_valid_email_format(email):
@@ -40,41 +123,41 @@ class EmailVerifier:
             # Extract domain
             domain = email.split('@')[1].lower()
             
+            # Disposable providers accept anything, so skip the network
+            if domain in self.disposable_domains:
+                return False, "DISPOSABLE_EMAIL"
+            
             # Get MX records
             try:
-                mx_records = dns.resolver.resolve(domain, 'MX')
-                mx_record = str(mx_records[0].exchange).rstrip('.')
-            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, Exception) as e:
+                mx_records = mx_hint if mx_hint is not None else self._resolve_mx(domain)
+            except Exception:
+                mx_records = []
+            
+            if not mx_records:
                 return False, f"No MX record found for domain: {domain}"
+            mx_record = mx_records[0]
+            
+            # Skip the SMTP conversation for providers that cannot be probed
+            if _DOMAIN_POLICY.get(domain) == 'mx_only':
+                return True, "MX verified (provider blocks SMTP verification)"
             
             # SMTP verification
             try:
-                # Create SMTP connection
-                server = smtplib.SMTP(timeout=self.timeout)
-                server.set_debuglevel(0)
-                
-                # Connect to MX server
-                server.connect(mx_record, 25)
-                
-                # SMTP conversation
-                server.helo(socket.gethostname())
-                server.mail(self.sender_email)
+                server = self._get_smtp_connection(mx_record)
                 
-                # The key part - check if recipient exists
-                code, message = server.rcpt(email)
-                server.quit()
+                try:
+                    server.mail(self.sender_email)
+                    
+                    # The key part - check if recipient exists
+                    code, message = server.rcpt(email)
+                    
+                    # Reset the transaction so the connection can be reused
+                    server.rset()
+                except Exception:
+                    self._discard_smtp_connection(mx_record)
+                    raise
                 
-                # Analyze response code
-                if code == 250:
-                    return True, "Email address exists"
-                elif code == 550:
-                    return False, "Email address does not exist"
-                elif code == 552:
-                    return False, "Mailbox full or quota exceeded"
-                elif code == 553:
-                    return False, "Invalid email address"
-                else:
-                    return False, f"SMTP error code: {code}"
+                return self._interpret_rcpt_code(code)
                     
             except smtplib.SMTPConnectError:
                 return False, "Cannot connect to SMTP server"
@@ -90,6 +173,307 @@ class EmailVerifier:
         except Exception as e:
             return False, "error"
     
+    async def verify_email_async(self, email: str, mx_hint: Optional[List[str]] = None) -> Tuple[bool, str]:
+        """
+        Verify if an email address exists using asynchronous SMTP validation
+        
+        Args:
+            email: Email address to verify
+            mx_hint: Already-resolved MX hosts for the email's domain, skips the DNS lookup
+            
+        Returns:
+            Tuple of (is_valid: bool, details: str)
+        """
+        key = email.strip().lower()
+        if key not in self._email_cache:
+            self._email_cache[key] = await self._verify_email_uncached_async(email, mx_hint)
+        return self._email_cache[key]
+    
+    async def _verify_email_uncached_async(self, email: str, mx_hint: Optional[List[str]] = None) -> Tuple[bool, str]:
+        """Run the DNS and SMTP checks for a single email asynchronously"""
+        try:
+            # Basic format validation
+            if not self._is_valid_email_format(email):
+                return False, "Invalid email format"
+            
+            # Extract domain
+            domain = email.split('@')[1].lower()
+            
+            # Disposable providers accept anything, so skip the network
+            if domain in self.disposable_domains:
+                return False, "DISPOSABLE_EMAIL"
+            
+            # Get MX records
+            try:
+                mx_records = mx_hint if mx_hint is not None else await self._resolve_mx_async(domain)
+            except Exception:
+                mx_records = []
+            
+            if not mx_records:
+                return False, f"No MX record found for domain: {domain}"
+            mx_record = mx_records[0]
+            
+            # Skip the SMTP conversation for providers that cannot be probed
+            if _DOMAIN_POLICY.get(domain) == 'mx_only':
+                return True, "MX verified (provider blocks SMTP verification)"
+            
+            # SMTP verification
+            try:
+                # One conversation at a time per connection
+                lock = self._async_smtp_locks.setdefault(mx_record, asyncio.Lock())
+                async with lock:
+                    smtp = await self._get_async_smtp_connection(mx_record)
+                    
+                    try:
+                        await smtp.mail(self.sender_email)
+                        
+                        # aiosmtplib raises on any RCPT reply other than 250/251
+                        try:
+                            response = await smtp.rcpt(email)
+                            code = response.code
+                        except aiosmtplib.SMTPRecipientRefused as refused:
+                            code = refused.code
+                        
+                        # Reset the transaction so the connection can be reused
+                        await smtp.rset()
+                    except Exception:
+                        await self._discard_async_smtp_connection(mx_record)
+                        raise
+                
+                return self._interpret_rcpt_code(code)
+                
+            except aiosmtplib.SMTPTimeoutError:
+                return False, "SMTP connection timeout"
+            except aiosmtplib.SMTPConnectError:
+                return False, "Cannot connect to SMTP server"
+            except aiosmtplib.SMTPServerDisconnected:
+                return False, "SMTP server disconnected"
+            except asyncio.TimeoutError:
+                return False, "SMTP connection timeout"
+            except Exception as smtp_e:
+                return False, f"SMTP error: {str(smtp_e)}"
+                
+        except Exception as e:
+            return False, "error"
+    
+    def _resolve_mx(self, domain: str) -> List[str]:
+        """
+        Resolve MX hosts for a domain, using the TTL cache when possible
+        
+        Args:
+            domain: Domain name
+            
+        Returns:
+            List[str]: MX hosts ordered by preference, empty if the domain has none
+        """
+        cached = self._get_cached_mx(domain)
+        if cached is not None:
+            return cached
+        
+        try:
+            answer = dns.resolver.resolve(domain, 'MX')
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return self._cache_mx(domain, [], NEGATIVE_MX_CACHE_TTL)
+        
+        return self._cache_mx_answer(domain, answer)
+    
+    async def _resolve_mx_async(self, domain: str) -> List[str]:
+        """
+        Resolve MX hosts for a domain asynchronously, sharing the TTL cache
+        
+        Args:
+            domain: Domain name
+            
+        Returns:
+            List[str]: MX hosts ordered by preference, empty if the domain has none
+        """
+        cached = self._get_cached_mx(domain)
+        if cached is not None:
+            return cached
+        
+        try:
+            answer = await dns.asyncresolver.Resolver().resolve(domain, 'MX')
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return self._cache_mx(domain, [], NEGATIVE_MX_CACHE_TTL)
+        
+        return self._cache_mx_answer(domain, answer)
+    
+    def prefetch_mx(self, domains: Iterable[str], max_workers: int = 32) -> Dict[str, List[str]]:
+        """
+        Resolve MX hosts for many domains concurrently ahead of verification
+        
+        Results also land in the TTL cache. Domains whose lookup fails with a
+        transient error are left out so verification retries them.
+        
+        Args:
+            domains: Domain names to resolve
+            max_workers: Maximum number of concurrent DNS lookups
+            
+        Returns:
+            Dict[str, List[str]]: MX hosts keyed by domain
+        """
+        domains = list(dict.fromkeys(domain.lower() for domain in domains))
+        if not domains:
+            return {}
+        
+        def resolve(domain: str) -> Optional[List[str]]:
+            try:
+                return self._resolve_mx(domain)
+            except Exception:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(domains))) as executor:
+            resolved = list(executor.map(resolve, domains))
+        
+        return {
+            domain: mx_hosts
+            for domain, mx_hosts in zip(domains, resolved)
+            if mx_hosts is not None
+        }
+    
+    def _get_cached_mx(self, domain: str) -> Optional[List[str]]:
+        """Return cached MX hosts for a domain, or None if missing or expired"""
+        entry = self._mx_cache.get(domain)
+        if entry is None:
+            return None
+        
+        mx_hosts, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._mx_cache.pop(domain, None)
+            return None
+        
+        return mx_hosts
+    
+    def _cache_mx_answer(self, domain: str, answer) -> List[str]:
+        """Cache the MX hosts from a DNS answer for the record's TTL"""
+        records = sorted(answer, key=lambda record: record.preference)
+        mx_hosts = [str(record.exchange).rstrip('.') for record in records]
+        
+        rrset = getattr(answer, 'rrset', None)
+        ttl = getattr(rrset, 'ttl', None) or MX_CACHE_TTL
+        
+        return self._cache_mx(domain, mx_hosts, ttl)
+    
+    def _cache_mx(self, domain: str, mx_hosts: List[str], ttl: float) -> List[str]:
+        """Store MX hosts for a domain and return them"""
+        self._mx_cache[domain] = (mx_hosts, time.monotonic() + ttl)
+        return mx_hosts
+    
+    def _get_smtp_connection(self, mx_record: str) -> smtplib.SMTP:
+        """
+        Get a pooled SMTP connection to an MX host, connecting if needed
+        
+        Args:
+            mx_record: MX host name
+            
+        Returns:
+            smtplib.SMTP: Connection that has completed HELO
+        """
+        server = self._smtp_pool.get(mx_record)
+        if server is not None:
+            # Health check before reuse
+            try:
+                code, message = server.noop()
+                if code == 250:
+                    return server
+            except (smtplib.SMTPServerDisconnected, OSError):
+                pass
+            self._discard_smtp_connection(mx_record)
+        
+        server = smtplib.SMTP(timeout=self.timeout)
+        server.set_debuglevel(0)
+        server.connect(mx_record, 25)
+        server.helo(socket.gethostname())
+        
+        self._smtp_pool[mx_record] = server
+        return server
+    
+    def _discard_smtp_connection(self, mx_record: str):
+        """Remove a connection from the pool and close it"""
+        server = self._smtp_pool.pop(mx_record, None)
+        if server is None:
+            return
+        
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    def close_all(self):
+        """Close all pooled SMTP connections"""
+        for mx_record in list(self._smtp_pool):
+            self._discard_smtp_connection(mx_record)
+    
+    async def _get_async_smtp_connection(self, mx_record: str) -> aiosmtplib.SMTP:
+        """
+        Get a pooled asynchronous SMTP connection to an MX host, connecting if needed
+        
+        Args:
+            mx_record: MX host name
+            
+        Returns:
+            aiosmtplib.SMTP: Connection that has completed HELO
+        """
+        smtp = self._async_smtp_pool.get(mx_record)
+        if smtp is not None:
+            # Health check before reuse
+            try:
+                response = await smtp.noop()
+                if response.code == 250:
+                    return smtp
+            except (aiosmtplib.SMTPException, OSError):
+                pass
+            await self._discard_async_smtp_connection(mx_record)
+        
+        smtp = aiosmtplib.SMTP(hostname=mx_record, port=25, timeout=self.timeout, start_tls=False)
+        await smtp.connect()
+        await smtp.helo(hostname=socket.gethostname())
+        
+        self._async_smtp_pool[mx_record] = smtp
+        return smtp
+    
+    async def _discard_async_smtp_connection(self, mx_record: str):
+        """Remove an asynchronous connection from the pool and close it"""
+        smtp = self._async_smtp_pool.pop(mx_record, None)
+        if smtp is None:
+            return
+        
+        try:
+            await smtp.quit()
+        except Exception:
+            smtp.close()
+    
+    async def close_all_async(self):
+        """Close all pooled asynchronous SMTP connections"""
+        for mx_record in list(self._async_smtp_pool):
+            await self._discard_async_smtp_connection(mx_record)
+        
+        # Locks are bound to the event loop that used them
+        self._async_smtp_locks.clear()
+    
+    def _interpret_rcpt_code(self, code: int) -> Tuple[bool, str]:
+        """
+        Map an SMTP RCPT TO response code to a verification result
+        
+        Args:
+            code: SMTP response code
+            
+        Returns:
+            Tuple of (is_valid: bool, details: str)
+        """
+        if code == 250:
+            return True, "Email address exists"
+        elif code == 550:
+            return False, "Email address does not exist"
+        elif code == 552:
+            return False, "Mailbox full or quota exceeded"
+        elif code == 553:
+            return False, "Invalid email address"
+        elif 400 <= code < 500:
+            return False, f"{GREYLISTED}: temporary failure (code {code}), retry later"
+        else:
+            return False, f"SMTP error code: {code}"
+    
     def _is_valid_email_format(self, email: str) -> bool:
         """
         Validate email format using regex
@@ -100,8 +484,7 @@ class EmailVerifier:
         Returns:
             bool: True if format is valid
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     def verify_email_batch(self, emails: list, delay: float = 1.0) -> dict:
         """
@@ -116,6 +499,9 @@ class EmailVerifier:
         """
         results = {}
         
+        # Group by domain so pooled connections are reused back to back
+        emails = sorted(emails, key=lambda email: email.split('@')[-1].lower())
+        
         for email in emails:
             is_valid, details = self.verify_email(email)
             results[email] = {
@@ -129,6 +515,83 @@ class EmailVerifier:
         
         return results
     
+    async def verify_email_batch_async(
+        self,
+        emails: list,
+        delay: float = 1.0,
+        concurrency: int = 20,
+        progress_callback: Optional[Callable[[str, bool, str], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        mx_hints: Optional[Dict[str, List[str]]] = None
+    ) -> dict:
+        """
+        Verify multiple emails concurrently, one sequential worker per domain
+        
+        SMTP is sequential per connection, so emails for the same domain are
+        checked one at a time with ``delay`` between them, while different
+        domains are verified in parallel.
+        
+        Args:
+            emails: List of email addresses to verify
+            delay: Delay between verifications against the same domain in seconds
+            concurrency: Maximum number of SMTP conversations in flight
+            progress_callback: Called with (email, is_valid, details) as each result arrives
+            should_stop: Checked before each verification; returning True ends the batch early
+            mx_hints: Prefetched MX hosts keyed by domain (see prefetch_mx)
+            
+        Returns:
+            dict: Email verification results
+        """
+        results = {}
+        semaphore = asyncio.Semaphore(concurrency)
+        completed = asyncio.Queue()
+        
+        mx_hints = mx_hints or {}
+        
+        # Group emails by domain
+        domain_queues = {}
+        for email in emails:
+            domain = email.split('@')[-1].lower()
+            domain_queues.setdefault(domain, asyncio.Queue()).put_nowait(email)
+        
+        async def domain_worker(domain: str, queue: asyncio.Queue):
+            while not queue.empty():
+                if should_stop is not None and should_stop():
+                    return
+                
+                email = queue.get_nowait()
+                async with semaphore:
+                    is_valid, details = await self.verify_email_async(email, mx_hint=mx_hints.get(domain))
+                await completed.put((email, is_valid, details))
+                
+                # Rate limiting per domain
+                if not queue.empty():
+                    await asyncio.sleep(delay)
+        
+        async def report_results():
+            while True:
+                item = await completed.get()
+                if item is None:
+                    break
+                
+                email, is_valid, details = item
+                results[email] = {
+                    'is_valid': is_valid,
+                    'details': details
+                }
+                if progress_callback is not None:
+                    progress_callback(email, is_valid, details)
+        
+        reporter = asyncio.create_task(report_results())
+        try:
+            await asyncio.gather(*(domain_worker(domain, queue) for domain, queue in domain_queues.items()))
+        finally:
+            await self.close_all_async()
+            await completed.put(None)
+            await reporter
+        
+        return results
+    
     def get_domain_info(self, email: str) -> dict:
         """
         Get domain information for an email address
@@ -144,8 +607,7 @@ class EmailVerifier:
             
             # Get MX records
             try:
-                mx_records = dns.resolver.resolve(domain, 'MX')
-                mx_list = [str(record.exchange).rstrip('.') for record in mx_records]
+                mx_list = self._resolve_mx(domain)
             except:
                 mx_list = []
             
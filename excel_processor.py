@@ -1,9 +1,40 @@
 import pandas as pd
 import re
 import io
-from typing import List, Optional
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import CellIsRule
 from openpyxl.styles import PatternFill, Font
+from openpyxl.utils import get_column_letter
+
+# Prefer RE2's linear-time matching when it is installed
+try:
+    import re2 as re_engine
+except ImportError:
+    re_engine = re
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+STRING_DTYPE = pd.StringDtype("pyarrow") if HAS_PYARROW else pd.StringDtype()
+
+# Polars gives a much faster streaming CSV reader when it is installed
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+logger = logging.getLogger(__name__)
+
+# Series.str.match takes the pattern string so pandas can use its own engine
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+_EMAIL_RE = re_engine.compile(EMAIL_PATTERN)
 
 
 class ExcelProcessor:
@@ -13,14 +44,14 @@ class ExcelProcessor:
     
     def __init__(self):
         """Initialize Excel processor"""
-        self.email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        self.email_pattern = EMAIL_PATTERN
     
     def read_excel(self, file_path_or_buffer) -> pd.DataFrame:
         """
         Read Excel file and return DataFrame
         
         Args:
-            file_path_or_buffer: File path or buffer object
+            file_path_or_buffer: File path, buffer object or raw file bytes
             
         Returns:
             pd.DataFrame: Loaded data
@@ -28,9 +59,9 @@ class ExcelProcessor:
         try:
             # Try to read as .xlsx first, then .xls
             try:
-                df = pd.read_excel(file_path_or_buffer, engine='openpyxl')
+                df = pd.read_excel(self._as_source(file_path_or_buffer), engine='openpyxl')
             except:
-                df = pd.read_excel(file_path_or_buffer, engine='xlrd')
+                df = pd.read_excel(self._as_source(file_path_or_buffer), engine='xlrd')
             
             # Clean column names
             df.columns = df.columns.astype(str)
@@ -38,44 +69,228 @@ class ExcelProcessor:
             # Remove completely empty rows
             df = df.dropna(how='all')
             
-            return df
+            return self._optimize(df)
             
         except Exception as e:
             raise Exception(f"Error reading Excel file: {str(e)}")
     
-    def detect_email_columns(self, df: pd.DataFrame) -> List[str]:
+    def read_csv(self, file_path_or_buffer) -> pd.DataFrame:
         """
-        Auto-detect columns that likely contain email addresses
+        Read CSV file and return DataFrame
         
         Args:
-            df: Input DataFrame
+            file_path_or_buffer: File path, buffer object or raw file bytes
             
         Returns:
-            List[str]: Column names that likely contain emails
+            pd.DataFrame: Loaded data
+        """
+        try:
+            if pl is not None and HAS_PYARROW:
+                df = (
+                    pl.scan_csv(self._as_source(file_path_or_buffer), infer_schema_length=None)
+                    .collect(engine='streaming')
+                    .to_pandas(use_pyarrow_extension_array=True)
+                )
+            else:
+                df = pd.read_csv(self._as_source(file_path_or_buffer))
+            
+            # Clean column names
+            df.columns = df.columns.astype(str)
+            
+            # Remove completely empty rows
+            df = df.dropna(how='all')
+            
+            return self._optimize(df)
+            
+        except Exception as e:
+            raise Exception(f"Error reading CSV file: {str(e)}")
+    
+    def extract_valid_emails_csv(self, file_path_or_buffer, email_column: str) -> List[str]:
+        """
+        Extract valid email addresses from a CSV column without loading the other columns
+        
+        Args:
+            file_path_or_buffer: File path, buffer object or raw file bytes
+            email_column: Column name containing emails
+            
+        Returns:
+            List[str]: Unique valid email addresses
         """
-        email_columns = []
+        if pl is None or not HAS_PYARROW:
+            return self.extract_valid_emails(self.read_csv(file_path_or_buffer), email_column)
+        
+        emails = (
+            pl.scan_csv(self._as_source(file_path_or_buffer), infer_schema=False)
+            .select(pl.col(email_column).str.strip_chars())
+            .filter(pl.col(email_column).str.contains(EMAIL_PATTERN))
+            .collect(engine='streaming')
+            .get_column(email_column)
+            .to_list()
+        )
+        
+        # Drop duplicates while preserving order
+        return list(dict.fromkeys(emails))
+    
+    def _optimize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Shrink DataFrame memory by narrowing column dtypes
+        
+        Low-cardinality text columns become categoricals, numeric columns are
+        downcast where no precision is lost, and remaining text columns use
+        the (Arrow-backed when available) string dtype.
+        
+        Args:
+            df: Freshly loaded DataFrame
+            
+        Returns:
+            pd.DataFrame: DataFrame with optimized dtypes
+        """
+        if df.empty:
+            return df
+        
+        memory_before = df.memory_usage(deep=True).sum()
         
         for column in df.columns:
-            # Check column name for email-related keywords
-            column_lower = str(column).lower()
-            if any(keyword in column_lower for keyword in ['email', 'mail', 'e-mail', '@']):
-                email_columns.append(column)
+            series = df[column]
+            
+            if pd.api.types.is_bool_dtype(series):
                 continue
             
-            # Check actual data in column for email patterns
-            sample_size = min(10, len(df))
-            sample_data = df[column].dropna().head(sample_size)
+            if pd.api.types.is_integer_dtype(series):
+                df[column] = pd.to_numeric(series, downcast='integer')
+            
+            elif pd.api.types.is_float_dtype(series):
+                downcast = pd.to_numeric(series, downcast='float')
+                if downcast.astype(series.dtype).equals(series):
+                    df[column] = downcast
+            
+            elif series.dtype == object or pd.api.types.is_string_dtype(series):
+                if series.nunique(dropna=True) < 0.5 * len(series):
+                    df[column] = series.astype('category')
+                elif pd.api.types.infer_dtype(series, skipna=True) == 'string':
+                    df[column] = series.astype(STRING_DTYPE)
+        
+        memory_after = df.memory_usage(deep=True).sum()
+        logger.info("DataFrame memory reduced from %d to %d bytes", memory_before, memory_after)
+        
+        return df
+    
+    def read_excel_streaming(
+        self,
+        file_path_or_buffer,
+        target_columns: Optional[List[str]] = None,
+        chunksize: int = 10000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream an .xlsx file as DataFrame chunks without materializing the whole sheet
+        
+        Args:
+            file_path_or_buffer: File path, buffer object or raw file bytes
+            target_columns: Column names to keep (all columns if None)
+            chunksize: Maximum number of rows per chunk
+            
+        Returns:
+            Iterator[pd.DataFrame]: Chunks indexed like read_excel would index them
+        """
+        workbook = openpyxl.load_workbook(self._as_source(file_path_or_buffer), read_only=True, data_only=True)
+        
+        try:
+            worksheet = workbook.active
+            worksheet.reset_dimensions()
+            rows = worksheet.iter_rows(values_only=True)
+            
+            header = next(rows, None)
+            if header is None:
+                return
+            
+            columns = self._normalize_headers(header)
+            positions = [
+                idx for idx, column in enumerate(columns)
+                if target_columns is None or column in target_columns
+            ]
+            selected_columns = [columns[idx] for idx in positions]
+            
+            records = []
+            index = []
+            for row_number, row in enumerate(rows):
+                # Skip completely empty rows
+                if all(value is None for value in row):
+                    continue
+                
+                records.append([row[idx] if idx < len(row) else None for idx in positions])
+                index.append(row_number)
+                
+                if len(records) >= chunksize:
+                    yield pd.DataFrame.from_records(records, columns=selected_columns, index=index)
+                    records = []
+                    index = []
+            
+            if records:
+                yield pd.DataFrame.from_records(records, columns=selected_columns, index=index)
+        
+        finally:
+            workbook.close()
+    
+    def _normalize_headers(self, header: tuple) -> List[str]:
+        """Name header cells the way pandas does for blank and repeated names"""
+        columns = []
+        seen = {}
+        
+        for idx, value in enumerate(header):
+            name = f"Unnamed: {idx}" if value is None else str(value)
             
-            email_count = 0
-            for value in sample_data:
-                if self.is_valid_email_format(str(value)):
-                    email_count += 1
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            
+            columns.append(name)
+        
+        return columns
+    
+    def _as_source(self, file_path_or_buffer):
+        """Wrap raw bytes in a fresh buffer so each read starts at the beginning"""
+        if isinstance(file_path_or_buffer, bytes):
+            return io.BytesIO(file_path_or_buffer)
+        return file_path_or_buffer
+    
+    def detect_email_columns(self, df: pd.DataFrame) -> List[str]:
+        """
+        Auto-detect columns that likely contain email addresses
+        
+        Args:
+            df: Input DataFrame
             
-            # If more than 30% of samples are valid emails, consider it an email column
-            if sample_size > 0 and (email_count / sample_size) > 0.3:
-                email_columns.append(column)
+        Returns:
+            List[str]: Column names that likely contain emails
+        """
+        if len(df.columns) == 0:
+            return []
+        
+        # Scan columns in parallel; the regex matching releases the GIL in C
+        with ThreadPoolExecutor(max_workers=min(8, len(df.columns))) as executor:
+            is_email = list(executor.map(lambda column: self._is_email_column(df, column), df.columns))
+        
+        return [column for column, matched in zip(df.columns, is_email) if matched]
+    
+    def _is_email_column(self, df: pd.DataFrame, column: str) -> bool:
+        """Check a column's name and sample values for email content"""
+        # Check column name for email-related keywords
+        column_lower = str(column).lower()
+        if any(keyword in column_lower for keyword in ['email', 'mail', 'e-mail', '@']):
+            return True
         
-        return email_columns
+        # If more than 30% of samples are valid emails, consider it an email column
+        return self._score_column(df[column], sample_size=min(10, len(df))) > 0.3
+    
+    def _score_column(self, series: pd.Series, sample_size: int) -> float:
+        """Fraction of the sampled values that are valid email formats"""
+        if sample_size == 0:
+            return 0.0
+        
+        sample_data = series.dropna().head(sample_size)
+        return self.valid_email_mask(sample_data).sum() / sample_size
     
     def is_valid_email_format(self, email: str) -> bool:
         """
@@ -88,10 +303,22 @@ class ExcelProcessor:
             bool: True if valid email format
         """
         try:
-            return bool(re.match(self.email_pattern, email.strip()))
+            return _EMAIL_RE.match(email.strip()) is not None
         except:
             return False
     
+    def valid_email_mask(self, series: pd.Series) -> pd.Series:
+        """
+        Check every value of a Series against the email format in one pass
+        
+        Args:
+            series: Values to check
+            
+        Returns:
+            pd.Series: Boolean mask, True where the value is a valid email format
+        """
+        return series.astype(str).str.strip().str.match(EMAIL_PATTERN, na=False) & series.notna()
+    
     def extract_valid_emails(self, df: pd.DataFrame, email_column: str) -> List[str]:
         """
         Extract valid email addresses from specified column
@@ -101,52 +328,73 @@ class ExcelProcessor:
             email_column: Column name containing emails
             
         Returns:
-            List[str]: Valid email addresses
+            List[str]: Unique valid email addresses
         """
         if email_column not in df.columns:
             return []
         
-        valid_emails = []
-        for email in df[email_column].dropna():
-            email_str = str(email).strip()
-            if self.is_valid_email_format(email_str):
-                valid_emails.append(email_str)
+        emails = df[email_column].dropna().astype(str).str.strip()
+        valid_emails = emails[emails.str.match(EMAIL_PATTERN, na=False)].tolist()
         
-        return valid_emails
+        # Drop duplicates while preserving order
+        return list(dict.fromkeys(valid_emails))
     
-    def add_verification_columns(self, df: pd.DataFrame, results: dict) -> pd.DataFrame:
+    def add_verification_columns(self, df: pd.DataFrame, results: dict, email_column: Optional[str] = None) -> pd.DataFrame:
         """
         Add verification results to DataFrame
         
         Args:
             df: Original DataFrame
             results: Dictionary with email verification results
+            email_column: Column containing emails (auto-detected if None)
             
         Returns:
-            pd.DataFrame: DataFrame with verification columns added
+            pd.DataFrame: New DataFrame with verification columns added
         """
-        result_df = df.copy()
+        # Existing verification columns are kept, otherwise start from defaults
+        if 'Email_Verification_Status' in df.columns:
+            statuses = df['Email_Verification_Status'].astype(object)
+        else:
+            statuses = pd.Series('Not Checked', index=df.index, dtype=object)
+        
+        if 'Verification_Details' in df.columns:
+            details = df['Verification_Details'].astype(object)
+        else:
+            details = pd.Series('', index=df.index, dtype=object)
+        
+        if email_column is None:
+            email_columns = self.detect_email_columns(df)
+            email_column = email_columns[0] if email_columns else None
         
-        # Add verification columns if they don't exist
-        if 'Email_Verification_Status' not in result_df.columns:
-            result_df['Email_Verification_Status'] = 'Not Checked'
+        if email_column not in df.columns:
+            return df.assign(Email_Verification_Status=statuses, Verification_Details=details)
         
-        if 'Verification_Details' not in result_df.columns:
-            result_df['Verification_Details'] = ''
+        # Update results with one hash lookup per row
+        status_map = {
+            str(email).strip().lower(): 'Valid' if result['is_valid'] else 'Invalid'
+            for email, result in results.items()
+        }
+        details_map = {
+            str(email).strip().lower(): result['details']
+            for email, result in results.items()
+        }
         
-        # Update results
-        for email, result in results.items():
-            # Find rows with this email
-            mask = result_df.apply(lambda row: str(email) in row.values, axis=1)
-            result_df.loc[mask, 'Email_Verification_Status'] = 'Valid' if result['is_valid'] else 'Invalid'
-            result_df.loc[mask, 'Verification_Details'] = result['details']
+        key = df[email_column].astype(str).str.strip().str.lower()
+        matched = key.isin(status_map.keys())
         
-        return result_df
+        return df.assign(
+            Email_Verification_Status=key.map(status_map).where(matched, statuses),
+            Verification_Details=key.map(details_map).where(matched, details)
+        )
     
     def dataframe_to_excel(self, df: pd.DataFrame, include_formatting: bool = True) -> bytes:
         """
         Convert DataFrame to Excel file with optional formatting
         
+        Rows are streamed through a write-only workbook, so the sheet is never
+        held in memory as individual cell objects, and status colors are
+        stored as conditional formatting rules rather than per-cell fills.
+        
         Args:
             df: DataFrame to convert
             include_formatting: Whether to include color formatting
@@ -156,55 +404,68 @@ class ExcelProcessor:
         """
         buffer = io.BytesIO()
         
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Email_Verification_Results')
-            
-            if include_formatting and 'Email_Verification_Status' in df.columns:
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Email_Verification_Results']
-                
-                # Define colors for different statuses
-                valid_fill = PatternFill(start_color='90EE90', end_color='90EE90', fill_type='solid')  # Light green
-                invalid_fill = PatternFill(start_color='FFB6C1', end_color='FFB6C1', fill_type='solid')  # Light red
-                error_fill = PatternFill(start_color='FFE4B5', end_color='FFE4B5', fill_type='solid')  # Light orange
-                
-                # Find the status column
-                status_col_index = None
-                for idx, col in enumerate(df.columns, 1):
-                    if col == 'Email_Verification_Status':
-                        status_col_index = idx
-                        break
-                
-                if status_col_index:
-                    # Apply formatting to status column
-                    for row_idx in range(2, len(df) + 2):  # Start from row 2 (after header)
-                        cell = worksheet.cell(row=row_idx, column=status_col_index)
-                        if cell.value == 'Valid':
-                            cell.fill = valid_fill
-                        elif cell.value == 'Invalid':
-                            cell.fill = invalid_fill
-                        elif cell.value == 'Error':
-                            cell.fill = error_fill
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Email_Verification_Results')
+        
+        columns = [str(column) for column in df.columns]
+        format_status = include_formatting and 'Email_Verification_Status' in columns
+        
+        # Define colors for different statuses
+        valid_fill = PatternFill(start_color='90EE90', end_color='90EE90', fill_type='solid')  # Light green
+        invalid_fill = PatternFill(start_color='FFB6C1', end_color='FFB6C1', fill_type='solid')  # Light red
+        error_fill = PatternFill(start_color='FFE4B5', end_color='FFE4B5', fill_type='solid')  # Light orange
+        greylisted_fill = PatternFill(start_color='FFFFE0', end_color='FFFFE0', fill_type='solid')  # Light yellow
+        status_fills = {
+            'Valid': valid_fill,
+            'Invalid': invalid_fill,
+            'Error': error_fill,
+            'Greylisted': greylisted_fill
+        }
+        
+        status_col_index = columns.index('Email_Verification_Status') if format_status else None
+        
+        if format_status:
+            # Auto-adjust column widths; write-only sheets need them before any row
+            for idx, column in enumerate(columns):
+                lengths = df.iloc[:, idx].astype(str).str.len()
+                longest = int(lengths.max()) if lengths.notna().any() else 0
+                width = min(max(longest, len(column)) + 2, 50)  # Cap at 50 characters
+                worksheet.column_dimensions[get_column_letter(idx + 1)].width = width
+        
+        # Header row
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(worksheet, value=column)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        worksheet.append(header)
+        
+        # Data rows
+        for row in df.itertuples(index=False, name=None):
+            worksheet.append([None if self._is_missing(value) else value for value in row])
+        
+        if status_col_index is not None and len(df) > 0:
+            # Color the status column with one conditional formatting rule per status
+            col_letter = get_column_letter(status_col_index + 1)
+            status_range = f"{col_letter}2:{col_letter}{len(df) + 1}"
+            for status, fill in status_fills.items():
+                worksheet.conditional_formatting.add(
+                    status_range,
+                    CellIsRule(operator='equal', formula=[f'"{status}"'], fill=fill)
+                )
+        
+        workbook.save(buffer)
         
         buffer.seek(0)
         return buffer.getvalue()
     
+    def _is_missing(self, value) -> bool:
+        """Check for NaN/NA/NaT scalars, which Excel cells store as empty"""
+        try:
+            return bool(pd.isna(value))
+        except (TypeError, ValueError):
+            return False
+    
     def get_file_stats(self, df: pd.DataFrame, email_column: Optional[str] = None) -> dict:
         """
         Get statistics about the DataFrame and email data
@@ -225,12 +486,12 @@ class ExcelProcessor:
         
         if email_column and email_column in df.columns:
             email_series = df[email_column].dropna()
-            valid_emails = [email for email in email_series if self.is_valid_email_format(str(email))]
+            valid_emails = int(self.valid_email_mask(email_series).sum())
             
             stats.update({
                 'total_emails': len(email_series),
-                'valid_emails': len(valid_emails),
-                'invalid_emails': len(email_series) - len(valid_emails),
+                'valid_emails': valid_emails,
+                'invalid_emails': len(email_series) - valid_emails,
                 'empty_emails': df[email_column].isnull().sum()
             })
         
@@ -240,29 +501,31 @@ class ExcelProcessor:
         """
         Clean email data in the specified column
         
+        The column is replaced in place; pass a copy if the original frame
+        must stay untouched.
+        
         Args:
-            df: Input DataFrame
+            df: Input DataFrame, modified in place
             email_column: Column containing emails
             
         Returns:
-            pd.DataFrame: DataFrame with cleaned email data
+            pd.DataFrame: The same DataFrame with cleaned email data
         """
         if email_column not in df.columns:
             return df
         
-        cleaned_df = df.copy()
-        
         # Clean email strings
-        cleaned_df[email_column] = cleaned_df[email_column].apply(
-            lambda x: str(x).strip().lower() if pd.notna(x) else x
-        )
+        emails = df[email_column].astype(str).str.strip().str.lower()
         
         # Remove obviously invalid entries
-        cleaned_df[email_column] = cleaned_df[email_column].apply(
-            lambda x: x if (pd.notna(x) and '@' in str(x) and '.' in str(x)) else None
+        looks_like_email = (
+            df[email_column].notna()
+            & emails.str.contains('@', regex=False)
+            & emails.str.contains('.', regex=False)
         )
+        df[email_column] = emails.where(looks_like_email)
         
-        return cleaned_df
+        return df
     
     def create_summary_report(self, df: pd.DataFrame) -> dict:
         """
@@ -286,6 +549,7 @@ class ExcelProcessor:
             'valid_emails': status_counts.get('Valid', 0),
             'invalid_emails': status_counts.get('Invalid', 0),
             'errors': status_counts.get('Error', 0),
+            'greylisted': status_counts.get('Greylisted', 0),
             'not_checked': status_counts.get('Not Checked', 0),
             'invalid_format': status_counts.get('Invalid Format', 0),
             'success_rate': (status_counts.get('Valid', 0) / total_checked * 100) if total_checked > 0 else 0